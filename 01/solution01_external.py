@@ -0,0 +1,94 @@
+"""
+Part 1 for inputs that don't fit in memory: at most `budget` pairs are held
+in memory at any time (the optional second argument, 1000000 by default).
+
+# testing
+$ python3 solution01_external.py input01_test.txt 2
+11
+# part 1
+$ python3 solution01_external.py input01.txt 100
+2815556
+"""
+
+from heapq import merge
+from itertools import islice
+import os
+import sys
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from typing import Iterable, Iterator
+
+# the maximum number of runs that are merged at the same time
+# (i.e. the maximum number of files that are open at the same time)
+FAN_IN = 64
+
+
+def write_run(directory: str, items: Iterable[int]) -> str:
+    """
+    Write the `items` to a new file in `directory` (one item per line)
+    and return the name of the file
+    """
+    with NamedTemporaryFile("w", dir=directory, delete=False) as run:
+        run.writelines(f"{item}\n" for item in items)
+    return run.name
+
+
+def read_run(run: str) -> Iterator[int]:
+    """
+    Iterate over the items stored in a run (the file is only
+    open while the items are being read)
+    """
+    with open(run) as file:
+        for line in file:
+            yield int(line)
+
+
+def create_runs(
+    filename: str, directory: str, budget: int
+) -> tuple[list[str], list[str]]:
+    """
+    Read the input file in chunks of (at most) `budget` pairs, sort the two
+    lists in each chunk and store them as "runs" in files in `directory`.
+    Return the runs for each one of the two lists.
+    """
+    runs1, runs2 = [], []
+    with open(filename) as file:
+        pairs = (tuple(int(item) for item in line.split()) for line in file)
+        while chunk := list(islice(pairs, budget)):
+            l1, l2 = (sorted(l) for l in zip(*chunk))
+            del chunk
+            runs1.append(write_run(directory, l1))
+            runs2.append(write_run(directory, l2))
+    return runs1, runs2
+
+
+def reduce_runs(directory: str, runs: list[str]) -> list[str]:
+    """
+    Merge groups of (at most) FAN_IN runs into larger runs until
+    they are few enough to be merged all at the same time
+    """
+    while len(runs) > FAN_IN:
+        merged = []
+        for start in range(0, len(runs), FAN_IN):
+            group = runs[start:start + FAN_IN]
+            merged.append(write_run(directory, merge(*map(read_run, group))))
+            for run in group:
+                os.remove(run)
+        runs = merged
+    return runs
+
+
+budget = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+
+with TemporaryDirectory() as directory:
+    runs1, runs2 = (
+        reduce_runs(directory, runs)
+        for runs in create_runs(sys.argv[1], directory, budget)
+    )
+    # merge the runs of each list, so that the items of each list are
+    # streamed in sorted order, and pair the corresponding items
+    l1 = merge(*map(read_run, runs1))
+    l2 = merge(*map(read_run, runs2))
+    # the result is the sum of the "distances" of the corresponding items
+    result = sum(abs(item1-item2) for item1, item2 in zip(l1, l2))
+
+print(result)
@@ -0,0 +1,114 @@
+"""
+# testing
+$ python3 solution01_numpy.py input01_test.txt 1
+11
+$ python3 solution01_numpy.py input01_test.txt 2
+31
+# part 1
+$ python3 solution01_numpy.py input01.txt 1
+2815556
+# part 2
+$ python3 solution01_numpy.py input01.txt 2
+23927637
+"""
+
+import sys
+
+import numpy as np
+
+# the histogram-based algorithms are used when the range of the items is
+# at most this many times the number of items (or below MIN_SPAN anyway)
+SPAN_FACTOR = 8
+MIN_SPAN = 1 << 16
+
+
+def read_lists(filename: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the whole input file in bulk into an (n, 2) array of integers
+    and return its two columns, i.e. the two lists
+    """
+    with open(filename) as file:
+        pairs = np.fromstring(file.read(), dtype=np.int64, sep=" ")
+    pairs = pairs.reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def get_bounds(l1: np.ndarray, l2: np.ndarray) -> tuple[int, int] | None:
+    """
+    Return the smallest item and the size of the range covered by the
+    items of the two lists, if that range is small enough for histograms
+    to be used, or None otherwise
+    """
+    if len(l1) == 0:
+        return None
+    low = int(min(l1.min(), l2.min()))
+    span = int(max(l1.max(), l2.max())) - low + 1
+    if span <= max(SPAN_FACTOR * len(l1), MIN_SPAN):
+        return low, span
+    return None
+
+
+def histogram(items: np.ndarray, low: int, span: int) -> np.ndarray:
+    """
+    Return the number of occurrences of each value in the range
+    starting at `low` and covering `span` values
+    """
+    return np.bincount(items - low, minlength=span)
+
+
+def distance_bounded(l1: np.ndarray, l2: np.ndarray, low: int, span: int) -> int:
+    """
+    Return the sum of the "distances" of the corresponding items of the two
+    (sorted) lists, by walking the histograms of the two lists in step:
+    every unit interval [v, v+1] is crossed by as many pairs of corresponding
+    items as the difference between the number of items up to `v` in each list
+    """
+    cumulative1 = np.cumsum(histogram(l1, low, span))
+    cumulative2 = np.cumsum(histogram(l2, low, span))
+    return int(np.abs(cumulative1 - cumulative2).sum())
+
+
+def similarity_bounded(l1: np.ndarray, l2: np.ndarray, low: int, span: int) -> int:
+    """
+    Return the similarity score of the two lists as the dot product
+    of their histograms, weighted by the value of each item
+    """
+    values = np.arange(low, low + span, dtype=np.int64)
+    return int(np.dot(values * histogram(l1, low, span), histogram(l2, low, span)))
+
+
+def distance(l1: np.ndarray, l2: np.ndarray) -> int:
+    """
+    Return the sum of the "distances" of the corresponding items
+    of the two lists, once both of them have been sorted
+    """
+    return int(np.abs(np.sort(l1) - np.sort(l2)).sum())
+
+
+def similarity(l1: np.ndarray, l2: np.ndarray) -> int:
+    """
+    Return the sum of the items in the first list, each one multiplied
+    by the number of times it appears in the second list
+    """
+    # the distinct items of the second list (sorted) and their occurrences
+    values, occurences = np.unique(l2, return_counts=True)
+    # locate each item of the first list among the distinct items of the
+    # second list (items that don't appear in the second list count as 0)
+    indices = np.searchsorted(values, l1)
+    indices[indices == len(values)] = 0
+    found = values[indices] == l1
+    return int((l1[found] * occurences[indices[found]]).sum())
+
+
+l1, l2 = read_lists(sys.argv[1])
+part = int(sys.argv[2])
+# use the histogram-based algorithms if the items are in a bounded range,
+# otherwise fall back to sorting
+if (bounds := get_bounds(l1, l2)) is not None:
+    if part == 1:
+        result = distance_bounded(l1, l2, *bounds)
+    else:
+        result = similarity_bounded(l1, l2, *bounds)
+else:
+    result = distance(l1, l2) if part == 1 else similarity(l1, l2)
+print(result)
@@ -1,5 +1,7 @@
-from itertools import pairwise
-import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise, repeat
+import os
 
 
 def is_safe_pair_ascending(previous, current):
@@ -26,10 +28,56 @@ def is_safe(line):
     return False
 
 
-with open(sys.argv[1]) as file:
-    # read each line as an iterator over its integer element
-    lines = ((int(item) for item in line.split()) for line in file)
-    # count the number of "safe" lines
-    result = sum(is_safe(line) for line in lines)
+def get_chunks(filename: str, workers: int) -> list[tuple[int, int]]:
+    """
+    Split the input file into `workers` byte ranges of roughly equal size,
+    aligned so that every range starts at the beginning of a line
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as file:
+        for worker in range(1, workers):
+            # move to the approximate boundary and then to the start of the next line
+            file.seek(max(size * worker // workers, boundaries[-1]))
+            file.readline()
+            boundaries.append(min(file.tell(), size))
+    boundaries.append(size)
+    return list(pairwise(boundaries))
 
-print(result)
\ No newline at end of file
+
+def count_safe(filename: str, start: int, end: int) -> int:
+    """
+    Count the number of "safe" lines in the byte range [`start`, `end`)
+    of the input file
+    """
+    result = 0
+    with open(filename, "rb") as file:
+        file.seek(start)
+        for line in file:
+            if start >= end:
+                break
+            start += len(line)
+            # read the line as an iterator over its integer elements
+            result += is_safe(int(item) for item in line.split())
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="number of processes among which the input file is split"
+    )
+    args = parser.parse_args()
+
+    if args.workers == 1:
+        result = count_safe(args.filename, 0, os.path.getsize(args.filename))
+    else:
+        # count the "safe" lines in each chunk of the file in parallel
+        # and add up the partial counts
+        starts, ends = zip(*get_chunks(args.filename, args.workers))
+        with ProcessPoolExecutor(args.workers) as executor:
+            result = sum(executor.map(count_safe, repeat(args.filename), starts, ends))
+
+    print(result)
@@ -0,0 +1,83 @@
+"""
+The second argument is the maximum number of levels that the
+"problem dampener" may remove from each report.
+
+# testing
+$ python3 solution02_dampener.py input02_test.txt 0
+2
+$ python3 solution02_dampener.py input02_test.txt 1
+4
+# part 1
+$ python3 solution02_dampener.py input02.txt 0
+524
+# part 2
+$ python3 solution02_dampener.py input02.txt 1
+569
+"""
+
+from math import inf
+import sys
+from typing import Optional, Sequence
+
+
+def is_safe_pair_ascending(previous, current):
+    return previous < current <= previous + 3
+
+def is_safe_pair_descending(previous, current):
+    return previous > current >= previous - 3
+
+
+def dampen(levels: Sequence[int], k: int) -> Optional[tuple[int, ...]]:
+    """
+    Return the indices of the (fewest) levels that need to be removed for
+    the report to become safe, or None if more than `k` would be needed.
+
+    In a single pass over the levels and for both directions at once, compute
+    the fewest removals that make the prefix ending at each level safe, given
+    that the level itself is kept. Since at most `k` levels can be removed,
+    the level kept before it is one of the `k + 1` levels preceding it.
+    """
+    n = len(levels)
+    directions = (is_safe_pair_ascending, is_safe_pair_descending)
+    # for each direction: the fewest removals for each prefix and
+    # the index of the level kept before the last level of the prefix
+    costs = {direction: [] for direction in directions}
+    kept_before = {direction: [] for direction in directions}
+    for current in range(n):
+        for is_safe_pair in directions:
+            cost = costs[is_safe_pair]
+            # all the levels before the current one could be removed...
+            best, best_previous = (current, None) if current <= k else (inf, None)
+            # ... or one of the preceding levels could be kept
+            for previous in range(max(0, current - k - 1), current):
+                candidate = cost[previous] + current - previous - 1
+                if candidate < best and is_safe_pair(levels[previous], levels[current]):
+                    best, best_previous = candidate, previous
+            cost.append(best)
+            kept_before[is_safe_pair].append(best_previous)
+    # the last level kept is one of the last `k + 1` levels
+    best, best_last, best_direction = inf, None, None
+    for is_safe_pair in directions:
+        for last in range(max(0, n - k - 1), n):
+            candidate = costs[is_safe_pair][last] + n - 1 - last
+            if candidate < best:
+                best, best_last, best_direction = candidate, last, is_safe_pair
+    if best > k:
+        return None
+    # follow the kept levels backwards to recover the removed ones
+    kept = set()
+    current = best_last
+    while current is not None:
+        kept.add(current)
+        current = kept_before[best_direction][current]
+    return tuple(index for index in range(n) if index not in kept)
+
+
+k = int(sys.argv[2])
+with open(sys.argv[1]) as file:
+    # read each line as a tuple of its integer elements
+    lines = (tuple(int(item) for item in line.split()) for line in file)
+    # count the number of lines that are "safe" after at most `k` removals
+    result = sum(dampen(line, k) is not None for line in lines)
+
+print(result)
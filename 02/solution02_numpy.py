@@ -0,0 +1,80 @@
+"""
+# testing
+$ python3 solution02_numpy.py input02_test.txt 1
+2
+$ python3 solution02_numpy.py input02_test.txt 2
+4
+# part 1
+$ python3 solution02_numpy.py input02.txt 1
+524
+# part 2
+$ python3 solution02_numpy.py input02.txt 2
+569
+"""
+
+import sys
+
+import numpy as np
+
+
+def read_reports(filename: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read all the reports (lines) in the input file into a 2-D array,
+    padded on the right with zeros, and return it along with a mask
+    of the same shape marking the actual levels of each report
+    """
+    with open(filename, "rb") as file:
+        data = file.read()
+    # locate the first digit of every level in the input and the line it's on
+    text = np.frombuffer(data, dtype=np.uint8)
+    is_digit = (text >= ord("0")) & (text <= ord("9"))
+    starts = np.flatnonzero(is_digit & ~np.concatenate(([False], is_digit[:-1])))
+    lines = np.cumsum(text == ord("\n"))[starts]
+    # the number of levels in each (non-empty) report
+    _, lengths = np.unique(lines, return_counts=True)
+    # place each level in its report (row) and position (column)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    columns = np.arange(len(starts)) - offsets[rows]
+    mask = np.zeros((len(lengths), lengths.max()), dtype=bool)
+    mask[rows, columns] = True
+    reports = np.zeros(mask.shape, dtype=np.int64)
+    reports[mask] = np.fromstring(data, dtype=np.int64, sep=" ")
+    return reports, mask
+
+
+def are_safe(reports: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Return a boolean array indicating which of the `reports` are safe,
+    i.e. their levels (as indicated by the `mask`) are either all
+    ascending or all descending, by at least 1 and at most 3
+    """
+    diffs = np.diff(reports, axis=1)
+    # a difference is only relevant if both levels are in the report
+    # (the mask is contiguous from the left, so this is the right level)
+    irrelevant = ~mask[:, 1:]
+    ascending = ((diffs >= 1) & (diffs <= 3)) | irrelevant
+    descending = ((diffs <= -1) & (diffs >= -3)) | irrelevant
+    return ascending.all(axis=1) | descending.all(axis=1)
+
+
+def are_safe_dampened(reports: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Return a boolean array indicating which of the `reports` are safe,
+    either as they are or after removing a single level from them
+    """
+    safe = are_safe(reports, mask)
+    # remove each column in turn from all the reports at once
+    # (only reports that actually have a level in that column are affected)
+    for column in range(reports.shape[1]):
+        removed = np.delete(reports, column, axis=1)
+        removed_mask = np.delete(mask, column, axis=1)
+        safe |= are_safe(removed, removed_mask) & mask[:, column]
+    return safe
+
+
+reports, mask = read_reports(sys.argv[1])
+part = int(sys.argv[2])
+safe = are_safe(reports, mask) if part == 1 else are_safe_dampened(reports, mask)
+result = int(safe.sum())
+print(result)
@@ -0,0 +1,105 @@
+"""
+Compare the regex-based scanning of the original solutions with the
+regex-free tokenizer, on synthetic inputs where instructions are either
+dense or sparse. The (optional) argument is the size of the inputs in bytes.
+
+$ python3 benchmark03.py 10000000
+"""
+
+import random
+import re
+import sys
+from time import perf_counter
+
+from solution03_tokenizer import sum_enabled_products, sum_products
+
+pattern1 = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)")
+pattern2 = re.compile(
+    r"mul\((?P<num1>\d{1,3}),(?P<num2>\d{1,3})\)|"
+    r"(?P<enable>do\(\))|"
+    r"(?P<disable>don't\(\))"
+)
+
+
+def regex_part1(data: bytes) -> int:
+    """
+    The approach of solution03_1.py
+    """
+    return sum(
+        int(num1) * int(num2)
+        for num1, num2 in (match.groups() for match in pattern1.finditer(data.decode()))
+    )
+
+
+def regex_part2(data: bytes) -> int:
+    """
+    The approach of solution03_2.py
+    """
+    result = 0
+    enabled = True
+    for match in pattern2.finditer(data.decode()):
+        if match.group("enable"):
+            enabled = True
+        elif match.group("disable"):
+            enabled = False
+        elif enabled:
+            result += int(match.group("num1")) * int(match.group("num2"))
+    return result
+
+
+def generate(size: int, density: float) -> bytes:
+    """
+    Generate approximately `size` bytes of "corrupted memory", where each
+    chunk is an (often malformed) instruction with probability `density`
+    and a short run of noise otherwise
+    """
+    rng = random.Random(2024)
+    noise = "mud(),[]{}<>'+-*/@# !?%^&:;0123456789don'tmul"
+    chunks = []
+    length = 0
+    while length < size:
+        if rng.random() < density:
+            kind = rng.random()
+            if kind < 0.1:
+                chunk = "do()"
+            elif kind < 0.2:
+                chunk = "don't()"
+            else:
+                chunk = f"mul({rng.randrange(1_000)},{rng.randrange(1_000)})"
+                # some of the instructions are malformed
+                if kind > 0.9:
+                    chunk = chunk[:-1] + rng.choice(noise)
+                elif kind > 0.8:
+                    chunk = f"mul({rng.randrange(1_000, 10_000)},{rng.randrange(1_000)})"
+        else:
+            chunk = "".join(rng.choices(noise, k=rng.randrange(1, 8)))
+        chunks.append(chunk)
+        length += len(chunk)
+    return "".join(chunks).encode()
+
+
+def measure(function, data: bytes) -> tuple[int, float]:
+    """
+    Return the result of `function` on `data` and the time it took
+    """
+    start = perf_counter()
+    result = function(data)
+    return result, perf_counter() - start
+
+
+size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+solvers = {
+    1: (regex_part1, lambda data: sum_products(data, 0, len(data))),
+    2: (regex_part2, sum_enabled_products),
+}
+print(f"{'input':>8} {'part':>4} {'regex (s)':>10} {'tokenizer (s)':>14} {'speedup':>8}")
+for name, density in (("dense", 0.9), ("sparse", 0.01)):
+    data = generate(size, density)
+    for part, (regex, tokenizer) in solvers.items():
+        expected, regex_time = measure(regex, data)
+        result, tokenizer_time = measure(tokenizer, data)
+        assert result == expected, f"{name}, part {part}: {result} != {expected}"
+        print(
+            f"{name:>8} {part:>4} {regex_time:>10.3f} {tokenizer_time:>14.3f} "
+            f"{regex_time / tokenizer_time:>7.1f}x"
+        )
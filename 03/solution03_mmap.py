@@ -0,0 +1,186 @@
+"""
+Scan the memory-mapped input file in fixed-size windows, without reading it
+(or decoding it) as a whole.
+
+# testing
+$ python3 solution03_mmap.py input03_1_test.txt 1 --window 8
+161
+$ python3 solution03_mmap.py input03_2_test.txt 2 --window 8
+48
+# part 1
+$ python3 solution03_mmap.py input03.txt 1
+166630675
+# part 2
+$ python3 solution03_mmap.py input03.txt 2
+93465710
+# part 2, splitting the file among 4 processes
+$ python3 solution03_mmap.py input03.txt 2 --workers 4
+93465710
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import mmap
+import os
+import re
+from typing import Iterator, NamedTuple, Optional
+
+# patterns to match:
+# - "instructions like mul(X,Y), where X and Y are each 1-3 digit numbers"
+# - do()
+# - don't()
+pattern = re.compile(
+    rb"mul\((?P<num1>\d{1,3}),(?P<num2>\d{1,3})\)|"
+    rb"(?P<enable>do\(\))|"
+    rb"(?P<disable>don't\(\))"
+)
+
+# the length of the longest possible match, i.e. mul(XXX,YYY)
+MAX_MATCH_LENGTH = 12
+
+
+def scan(memory: mmap.mmap, start: int, end: int, window: int) -> Iterator[re.Match]:
+    """
+    Iterate over all the pattern matches that start in the range [`start`, `end`)
+    of the `memory`, scanning `window` bytes at a time. Each window is extended
+    so that matches straddling its end are found in that window; the matches
+    that start after the end of a window are left for the next one.
+    """
+    for window_start in range(start, end, window):
+        window_end = min(window_start + window, end)
+        scan_end = min(window_end + MAX_MATCH_LENGTH - 1, len(memory))
+        for match in pattern.finditer(memory, window_start, scan_end):
+            if match.start() >= window_end:
+                break
+            yield match
+
+
+def multiply(match: re.Match) -> int:
+    """
+    Return the product of the pair of numbers in a "mul" match
+    """
+    return int(match.group("num1")) * int(match.group("num2"))
+
+
+def total(matches: Iterator[re.Match]) -> int:
+    """
+    Return the sum of the products of all the "mul" matches
+    """
+    return sum(multiply(match) for match in matches if match.group("num1"))
+
+
+def total_enabled(matches: Iterator[re.Match]) -> int:
+    """
+    Return the sum of the products of the "mul" matches that are enabled,
+    i.e. not preceded by a don't() without a do() in between
+    """
+    result = 0
+    enabled = True
+    for match in matches:
+        if match.group("enable"):
+            enabled = True
+        elif match.group("disable"):
+            enabled = False
+        elif enabled:
+            result += multiply(match)
+    return result
+
+
+class Summary(NamedTuple):
+    """
+    The outcome of scanning a chunk of the input without knowing whether
+    the "mul" instructions are enabled or not at the start of the chunk
+    """
+    # the sum if the chunk starts enabled
+    enabled: int
+    # the sum if the chunk starts disabled
+    disabled: int
+    # the state at the end of the chunk (None if it's the same as at the start)
+    final: Optional[bool]
+
+
+def summarize(matches: Iterator[re.Match]) -> Summary:
+    """
+    Compute the sum of the enabled "mul" matches under both possible
+    starting states at once, along with the final state
+    """
+    results = {True: 0, False: 0}
+    # the current state for each one of the starting states
+    states = {True: True, False: False}
+    final = None
+    for match in matches:
+        if match.group("enable"):
+            states = {True: True, False: True}
+            final = True
+        elif match.group("disable"):
+            states = {True: False, False: False}
+            final = False
+        else:
+            for start, enabled in states.items():
+                if enabled:
+                    results[start] += multiply(match)
+    return Summary(results[True], results[False], final)
+
+
+def stitch(summaries: Iterator[Summary]) -> int:
+    """
+    Combine the summaries of consecutive chunks, passing the final state
+    of each chunk as the starting state of the next one
+    """
+    result = 0
+    enabled = True
+    for summary in summaries:
+        result += summary.enabled if enabled else summary.disabled
+        if summary.final is not None:
+            enabled = summary.final
+    return result
+
+
+def process_chunk(filename: str, part: int, start: int, end: int, window: int):
+    """
+    Scan the range [`start`, `end`) of the input file and return the sum of
+    the products of its "mul" matches (part 1) or its summary (part 2)
+    """
+    with open(filename, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            matches = scan(memory, start, end, window)
+            return total(matches) if part == 1 else summarize(matches)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename")
+    parser.add_argument("part", type=int, choices=(1, 2))
+    parser.add_argument(
+        "--window", type=int, default=1 << 20,
+        help="number of bytes scanned at a time"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="number of processes among which the input file is split"
+    )
+    args = parser.parse_args()
+
+    if os.path.getsize(args.filename) == 0:
+        # an empty file can't be memory-mapped (and contains no instructions)
+        result = 0
+    elif args.workers == 1:
+        with open(args.filename, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+                matches = scan(memory, 0, len(memory), args.window)
+                result = total(matches) if args.part == 1 else total_enabled(matches)
+    else:
+        # split the file into chunks of roughly equal size: a match belongs to
+        # the chunk it starts in, so the boundaries don't need to be aligned
+        size = os.path.getsize(args.filename)
+        boundaries = [size * worker // args.workers for worker in range(args.workers + 1)]
+        with ProcessPoolExecutor(args.workers) as executor:
+            results = executor.map(
+                process_chunk,
+                repeat(args.filename), repeat(args.part),
+                boundaries[:-1], boundaries[1:], repeat(args.window)
+            )
+            result = sum(results) if args.part == 1 else stitch(results)
+
+    print(result)
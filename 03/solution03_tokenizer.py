@@ -0,0 +1,106 @@
+"""
+A regex-free scanner: instructions are located with `bytes.find` and
+their numbers are parsed arithmetically from the values of the digit bytes.
+It is meant for inputs where the instructions are sparse and for part 2,
+where whole disabled sections are skipped: on inputs that are dense with
+mul( instructions, part 1 is about twice as slow as the regex, because
+every instruction is parsed in Python (see benchmark03.py).
+
+# testing
+$ python3 solution03_tokenizer.py input03_1_test.txt 1
+161
+$ python3 solution03_tokenizer.py input03_2_test.txt 2
+48
+# part 1
+$ python3 solution03_tokenizer.py input03.txt 1
+166630675
+# part 2
+$ python3 solution03_tokenizer.py input03.txt 2
+93465710
+"""
+
+import sys
+
+MUL = b"mul("
+DO = b"do()"
+DONT = b"don't()"
+COMMA = ord(",")
+CLOSE = ord(")")
+
+# the byte value of the digit zero
+ZERO = ord("0")
+
+
+def parse_number(data: bytes, index: int) -> tuple[int, int]:
+    """
+    Parse a number of 1-3 digits starting at `index`, from the values of the
+    digit bytes, and return it along with the index of the byte that follows
+    it (the number is -1 if there is no digit at `index`)
+    """
+    digit = data[index] - ZERO
+    if not 0 <= digit <= 9:
+        return -1, index
+    number = digit
+    digit = data[index + 1] - ZERO
+    if not 0 <= digit <= 9:
+        return number, index + 1
+    number = number * 10 + digit
+    digit = data[index + 2] - ZERO
+    if not 0 <= digit <= 9:
+        return number, index + 2
+    return number * 10 + digit, index + 3
+
+
+def sum_products(data: bytes, start: int, end: int) -> int:
+    """
+    Return the sum of the products of all the mul(X,Y) instructions (where
+    X and Y are each 1-3 digit numbers) that start in the range [`start`, `end`)
+    """
+    result = 0
+    position = data.find(MUL, start, end)
+    while position != -1:
+        position += len(MUL)
+        try:
+            num1, index = parse_number(data, position)
+            if num1 >= 0 and data[index] == COMMA:
+                num2, index = parse_number(data, index + 1)
+                if num2 >= 0 and data[index] == CLOSE:
+                    result += num1 * num2
+                    position = index + 1
+        except IndexError:
+            # the input ends in the middle of an instruction
+            pass
+        # the search can resume right after "mul(": an instruction cannot
+        # start before the first non-digit byte that follows it
+        position = data.find(MUL, position, end)
+    return result
+
+
+def sum_enabled_products(data: bytes) -> int:
+    """
+    Return the sum of the products of the mul(X,Y) instructions that are
+    enabled, i.e. not preceded by a don't() without a do() in between
+    """
+    result = 0
+    position = 0
+    while True:
+        # enabled: all the instructions up to the next don't() count
+        disable = data.find(DONT, position)
+        if disable == -1:
+            return result + sum_products(data, position, len(data))
+        result += sum_products(data, position, disable)
+        # disabled: skip everything up to the next do()
+        position = data.find(DO, disable + len(DONT))
+        if position == -1:
+            return result
+        position += len(DO)
+
+
+if __name__ == "__main__":
+    # read the input file as a single bytes object (without decoding it)
+    with open(sys.argv[1], "rb") as file:
+        data = file.read()
+
+    part = int(sys.argv[2])
+    result = sum_products(data, 0, len(data)) if part == 1 else sum_enabled_products(data)
+    print(result)
@@ -0,0 +1,158 @@
+"""
+Search for many words at once: every row, column and diagonal of the grid
+is streamed (in both directions) through a single Aho-Corasick automaton
+built from all the words.
+
+# testing
+$ python3 solution04_aho_corasick.py input04_test.txt XMAS
+XMAS: 18
+$ python3 solution04_aho_corasick.py input04_test.txt XMAS MAS
+XMAS: 18
+MAS: 38
+$ python3 solution04_aho_corasick.py input04_test.txt XMAS --positions
+XMAS (9, 9) North
+...
+$ python3 solution04_aho_corasick.py input04_test2.txt XMAS
+XMAS: 4
+# part 1
+$ python3 solution04_aho_corasick.py input04.txt XMAS
+XMAS: 2573
+"""
+
+import argparse
+from collections import deque
+from enum import Enum
+from math import inf
+from typing import Iterable, Iterator, Tuple
+
+
+class Direction(Enum):
+    North = (-1, 0)
+    Northeast = (-1, 1)
+    East = (0, 1)
+    Southeast = (1, 1)
+    South = (1, 0)
+    Southwest = (1, -1)
+    West = (0, -1)
+    Northwest = (-1, -1)
+
+
+Position = Tuple[int, int]
+
+
+class AhoCorasick:
+    """
+    An automaton that finds all the occurrences of a set of words in a stream
+    of letters in a single pass, in time linear in the length of the stream
+    plus the number of occurrences found
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words = list(words)
+        # the trie: the transitions of each node and
+        # the indices of the words that end at each node
+        self.transitions = [{}]
+        self.outputs = [[]]
+        for index, word in enumerate(self.words):
+            node = 0
+            for letter in word:
+                if letter not in self.transitions[node]:
+                    self.transitions.append({})
+                    self.outputs.append([])
+                    self.transitions[node][letter] = len(self.transitions) - 1
+                node = self.transitions[node][letter]
+            self.outputs[node].append(index)
+        # the failure links, computed breadth-first: the failure link of a node
+        # leads to the node for the longest proper suffix that is also in the trie
+        self.failures = [0] * len(self.transitions)
+        queue = deque(self.transitions[0].values())
+        while queue:
+            node = queue.popleft()
+            for letter, child in self.transitions[node].items():
+                failure = self.failures[node]
+                while failure and letter not in self.transitions[failure]:
+                    failure = self.failures[failure]
+                self.failures[child] = self.transitions[failure].get(letter, 0)
+                # the words ending at the suffix also end at the child
+                self.outputs[child] = self.outputs[child] + self.outputs[self.failures[child]]
+                queue.append(child)
+
+    def search(self, letters: Iterable[str]) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over the occurrences of the words in `letters`, as pairs of
+        the index of the letter where the occurrence ends and the word index
+        """
+        node = 0
+        for position, letter in enumerate(letters):
+            while node and letter not in self.transitions[node]:
+                node = self.failures[node]
+            node = self.transitions[node].get(letter, 0)
+            for index in self.outputs[node]:
+                yield position, index
+
+
+def ray_starts(direction: Direction, height: int, width: int) -> set[Position]:
+    """
+    Return the positions where rays in `direction` begin, i.e. the positions
+    where moving one step against `direction` leads outside the grid
+    """
+    row_offset, column_offset = direction.value
+    starts = set()
+    if row_offset:
+        row = 0 if row_offset > 0 else height - 1
+        starts.update((row, column) for column in range(width))
+    if column_offset:
+        column = 0 if column_offset > 0 else width - 1
+        starts.update((row, column) for row in range(height))
+    return starts
+
+
+def search_grid(lines: list[str], automaton: AhoCorasick) -> Iterator[Tuple[str, Position, Direction]]:
+    """
+    Stream every ray (row, column or diagonal, in each of the 8 directions)
+    of the grid through the `automaton` and iterate over the words found,
+    along with the position where each one starts and its direction
+    """
+    height, width = len(lines), len(lines[0])
+    for direction in Direction:
+        row_offset, column_offset = direction.value
+        for row, column in ray_starts(direction, height, width):
+            # the number of steps before the ray leaves the grid
+            # (an axis along which the ray doesn't move imposes no bound)
+            length = min(
+                inf if not row_offset else (row + 1 if row_offset < 0 else height - row),
+                inf if not column_offset else (column + 1 if column_offset < 0 else width - column),
+            )
+            letters = (
+                lines[row + step * row_offset][column + step * column_offset]
+                for step in range(length)
+            )
+            for end, index in automaton.search(letters):
+                word = automaton.words[index]
+                start = end - len(word) + 1
+                position = (row + start * row_offset, column + start * column_offset)
+                yield word, position, direction
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename")
+    parser.add_argument("words", nargs="+")
+    parser.add_argument(
+        "--positions", action="store_true",
+        help="also print where each occurrence starts and its direction"
+    )
+    args = parser.parse_args()
+
+    with open(args.filename) as file:
+        lines = file.read().split()
+
+    words = list(dict.fromkeys(args.words))
+    counts = dict.fromkeys(words, 0)
+    for word, position, direction in search_grid(lines, AhoCorasick(words)):
+        counts[word] += 1
+        if args.positions:
+            print(word, position, direction.name)
+
+    for word, count in counts.items():
+        print(f"{word}: {count}")
@@ -0,0 +1,71 @@
+"""
+Store the grid as a single flat buffer with a padded border, so that every
+direction is just an integer stride, and count the occurrences of the word
+by comparing shifted views of the buffer.
+
+# testing
+$ python3 solution04_flat.py input04_test.txt
+18
+# part 1
+$ python3 solution04_flat.py input04.txt
+2573
+"""
+
+import sys
+
+import numpy as np
+
+# the byte used for the padding (it never matches a letter of the word)
+PADDING = b"."
+
+
+def read_grid(filename: str, padding: int) -> tuple[np.ndarray, int]:
+    """
+    Read the input into a flat array of bytes, with each row padded by
+    `padding` bytes on both sides and `padding` empty rows above and below
+    the grid. Return the array and its (padded) width.
+    """
+    with open(filename, "rb") as file:
+        lines = file.read().split()
+    width = len(lines[0]) + 2 * padding
+    empty_row = PADDING * width
+    side = PADDING * padding
+    grid = b"".join(
+        [empty_row] * padding +
+        [side + line + side for line in lines] +
+        [empty_row] * padding
+    )
+    return np.frombuffer(grid, dtype=np.uint8), width
+
+
+def count(grid: np.ndarray, width: int, word: bytes) -> int:
+    """
+    Return the number of times the `word` appears in the `grid`, in any of
+    the 8 directions. The grid must be padded by at least `len(word) - 1`.
+    """
+    # the stride for each direction, i.e. the offset to the next position
+    strides = [
+        row_offset * width + column_offset
+        for row_offset in (-1, 0, 1)
+        for column_offset in (-1, 0, 1)
+        if row_offset or column_offset
+    ]
+    # the range of positions where the word could start: moving from them
+    # by up to `len(word) - 1` strides in any direction stays within the grid
+    margin = (len(word) - 1) * (width + 1)
+    start, end = margin, len(grid) - margin
+    result = 0
+    for stride in strides:
+        # the positions where the word starts, in the direction of `stride`
+        found = np.ones(end - start, dtype=bool)
+        for index, letter in enumerate(word):
+            offset = index * stride
+            found &= grid[start + offset:end + offset] == letter
+        result += int(found.sum())
+    return result
+
+
+word = b"XMAS"
+grid, width = read_grid(sys.argv[1], len(word) - 1)
+result = count(grid, width, word)
+print(result)
@@ -0,0 +1,97 @@
+"""
+Count the occurrences of a pattern given as a template (rows separated by
+"/", with "." matching anything), in any of its rotations and reflections,
+by comparing shifted slices of the grid with each letter of the template.
+
+# testing
+$ python3 solution04_template.py input04_test.txt
+9
+# part 2
+$ python3 solution04_template.py input04.txt
+1850
+# a plus-shaped cross, in this exact orientation only
+$ python3 solution04_template.py input04.txt --template ".M./MAS/.S." --fixed
+2
+"""
+
+import argparse
+
+import numpy as np
+
+# the X-MAS: two MAS crossing on their A
+X_MAS = "M.S/.A./M.S"
+WILDCARD = "."
+
+
+def read_grid(filename: str) -> np.ndarray:
+    """
+    Read the input into a 2-D array of letters, encoded as bytes
+    """
+    with open(filename, "rb") as file:
+        lines = file.read().split()
+    return np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(len(lines), -1)
+
+
+def variants(template: str) -> set[tuple[str, ...]]:
+    """
+    Return all the distinct rotations and reflections of the `template`,
+    each one as a tuple of rows
+    """
+    rows = tuple(template.split("/"))
+    result = set()
+    for _ in range(4):
+        result.add(rows)
+        result.add(tuple(row[::-1] for row in rows))
+        # rotate clockwise
+        rows = tuple("".join(column) for column in zip(*reversed(rows)))
+    return result
+
+
+def match(grid: np.ndarray, rows: tuple[str, ...]) -> np.ndarray:
+    """
+    Return a boolean array indicating, for every position where the top left
+    corner of the template (given as a tuple of `rows`) could be placed, if
+    the template matches the grid there
+    """
+    height, width = grid.shape
+    template_height, template_width = len(rows), len(rows[0])
+    found = np.ones(
+        (height - template_height + 1, width - template_width + 1), dtype=bool
+    )
+    for row_offset, row in enumerate(rows):
+        for column_offset, letter in enumerate(row):
+            if letter != WILDCARD:
+                # the grid shifted so that the letter aligns with the corner
+                shifted = grid[
+                    row_offset:row_offset + found.shape[0],
+                    column_offset:column_offset + found.shape[1]
+                ]
+                found &= shifted == ord(letter)
+    return found
+
+
+def count(grid: np.ndarray, templates: set[tuple[str, ...]]) -> int:
+    """
+    Return the total number of matches of the `templates` (two distinct
+    templates can only match at the same position with a different layout)
+    """
+    return sum(int(match(grid, rows).sum()) for rows in templates)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename")
+    parser.add_argument(
+        "--template", default=X_MAS,
+        help='the pattern, with rows separated by "/" and "." matching anything'
+    )
+    parser.add_argument(
+        "--fixed", action="store_true",
+        help="only match the template as given, not its rotations or reflections"
+    )
+    args = parser.parse_args()
+
+    grid = read_grid(args.filename)
+    templates = {tuple(args.template.split("/"))} if args.fixed else variants(args.template)
+    result = count(grid, templates)
+    print(result)
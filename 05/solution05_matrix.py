@@ -0,0 +1,113 @@
+"""
+Store the constraints as a dense boolean matrix indexed by number and
+process all the sequences at once, as a 2-D array padded on the right.
+
+# testing
+$ python3 solution05_matrix.py input05_test.txt 1
+143
+$ python3 solution05_matrix.py input05_test.txt 2
+123
+# part 1
+$ python3 solution05_matrix.py input05.txt 1
+5955
+# part 2
+$ python3 solution05_matrix.py input05.txt 2
+4030
+"""
+
+import sys
+
+import numpy as np
+
+
+def read_input(filename: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read the input and return:
+    - the constraint matrix, where `after[preceding, succeeding]` is True for
+      every "preceding|succeeding" constraint
+    - the sequences as a 2-D array, padded on the right with a number that
+      is not constrained in any way (the last index of the matrix)
+    - the length of each sequence
+    """
+    with open(filename) as file:
+        constraints, sequences = file.read().strip().split("\n\n")
+    pairs = np.fromstring(constraints.replace("|", " "), dtype=np.int64, sep=" ")
+    pairs = pairs.reshape(-1, 2)
+    lines = sequences.split("\n")
+    lengths = np.array([line.count(",") + 1 for line in lines])
+    numbers = np.fromstring(sequences.replace(",", " "), dtype=np.int64, sep=" ")
+    padding = int(max(pairs.max(), numbers.max())) + 1
+    after = np.zeros((padding + 1, padding + 1), dtype=bool)
+    after[pairs[:, 0], pairs[:, 1]] = True
+    padded = np.full((len(lines), lengths.max()), padding, dtype=np.int64)
+    padded[np.arange(lengths.max()) < lengths[:, None]] = numbers
+    return after, padded, lengths
+
+
+def are_valid(after: np.ndarray, sequences: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Return a boolean array indicating which of the `sequences` are valid,
+    i.e. every pair of consecutive numbers is constrained in that order
+    """
+    # look up the constraint for every pair of consecutive numbers at once
+    constrained = after[sequences[:, :-1], sequences[:, 1:]]
+    # pairs beyond the end of a sequence are irrelevant
+    irrelevant = np.arange(sequences.shape[1] - 1) >= lengths[:, None] - 1
+    return (constrained | irrelevant).all(axis=1)
+
+
+def topological_order(after: np.ndarray, sequence: np.ndarray) -> np.ndarray:
+    """
+    Order the numbers in the `sequence` so that they respect the constraints
+    among them, using Kahn's algorithm on the constraint matrix restricted to them
+    """
+    constraints = after[sequence[:, None], sequence[None, :]]
+    # the number of numbers in the sequence that need to come before each number
+    incoming = constraints.sum(axis=0)
+    ready = list(np.flatnonzero(incoming == 0))
+    order = []
+    while ready:
+        index = ready.pop()
+        order.append(index)
+        for succeeding in np.flatnonzero(constraints[index]):
+            incoming[succeeding] -= 1
+            if incoming[succeeding] == 0:
+                ready.append(succeeding)
+    return sequence[order]
+
+
+def middles(after: np.ndarray, sequences: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Return the number that would be in the middle of each one of the
+    `sequences` once ordered according to the constraints
+    """
+    # the rank of each number is the number of numbers that need to come
+    # after it (padding is not constrained, so it doesn't contribute)
+    ranks = after[sequences[:, :, None], sequences[:, None, :]].sum(axis=2)
+    middle_ranks = lengths - 1 - lengths // 2
+    columns = np.argmax(ranks == middle_ranks[:, None], axis=1)
+    result = sequences[np.arange(len(sequences)), columns]
+    # when there is a constraint for every pair of numbers in a sequence, the
+    # ranks are all distinct, i.e. once sorted they are 0, 1, ..., length - 1
+    # (the padding is given a rank that sorts it last)
+    padding = np.arange(sequences.shape[1]) >= lengths[:, None]
+    ranks[padding] = sequences.shape[1]
+    distinct = (
+        (np.sort(ranks, axis=1) == np.arange(sequences.shape[1])) | padding
+    ).all(axis=1)
+    # otherwise, fall back to a (complete) topological ordering
+    for index in np.flatnonzero(~distinct):
+        length = lengths[index]
+        result[index] = topological_order(after, sequences[index, :length])[length // 2]
+    return result
+
+after, sequences, lengths = read_input(sys.argv[1])
+part = int(sys.argv[2])
+valid = are_valid(after, sequences, lengths)
+if part == 1:
+    # the middle number of each valid sequence
+    result = sequences[valid, lengths[valid] // 2].sum()
+else:
+    # the middle number of each invalid sequence, once ordered
+    result = middles(after, sequences[~valid], lengths[~valid]).sum()
+print(int(result))
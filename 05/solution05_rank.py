@@ -0,0 +1,97 @@
+"""
+Instead of sorting the invalid sequences, rank the numbers in each sequence
+by the number of its numbers that need to come after them and select the
+middle number directly.
+
+# testing
+$ python3 solution05_rank.py input05_test.txt 1
+143
+$ python3 solution05_rank.py input05_test.txt 2
+123
+# part 1
+$ python3 solution05_rank.py input05.txt 1
+5955
+# part 2
+$ python3 solution05_rank.py input05.txt 2
+4030
+"""
+
+from collections import defaultdict, deque
+from itertools import pairwise
+import sys
+
+
+def is_valid(sequence: list[int], after: dict[int, set[int]]) -> bool:
+    """
+    Check if consequtive pairs of numbers in the `sequence` violate constraints
+    """
+    return all(succeeding in after[preceding] for preceding, succeeding in pairwise(sequence))
+
+
+def topological_order(sequence: list[int], after: dict[int, set[int]]) -> list[int]:
+    """
+    Order the numbers in the `sequence` so that they respect the constraints
+    among them, using Kahn's algorithm on the constraints restricted to them
+    """
+    numbers = set(sequence)
+    # the number of numbers in the sequence that need to come before each number
+    incoming = dict.fromkeys(sequence, 0)
+    for number in sequence:
+        for succeeding in after[number] & numbers:
+            incoming[succeeding] += 1
+    ready = deque(number for number in sequence if incoming[number] == 0)
+    order = []
+    while ready:
+        number = ready.popleft()
+        order.append(number)
+        for succeeding in after[number] & numbers:
+            incoming[succeeding] -= 1
+            if incoming[succeeding] == 0:
+                ready.append(succeeding)
+    return order
+
+
+def middle(sequence: list[int], after: dict[int, set[int]]) -> int:
+    """
+    Return the number that would be in the middle of the `sequence`
+    once ordered according to the constraints, without ordering it
+    """
+    numbers = set(sequence)
+    # the rank of each number is the number of numbers that need to come after it
+    ranks = {number: len(after[number] & numbers) for number in sequence}
+    # when there is a constraint for every pair of numbers, the ranks are all
+    # distinct and the number in the middle is the one with the middle rank
+    if len(set(ranks.values())) == len(sequence):
+        middle_rank = len(sequence) - 1 - len(sequence) // 2
+        return next(number for number, rank in ranks.items() if rank == middle_rank)
+    # otherwise, fall back to a (complete) topological ordering
+    return topological_order(sequence, after)[len(sequence) // 2]
+
+
+part = int(sys.argv[2])
+
+# read the input
+with open(sys.argv[1]) as file:
+    # for each "preceding|succeeding" constraint, record the succeeding number
+    # in the set of numbers that need to come after the preceding number
+    after = defaultdict(set)
+    for line in file:
+        line = line.strip()
+        if line:
+            preceding, succeeding = (int(item) for item in line.split("|"))
+            after[preceding].add(succeeding)
+        else:
+            # empty line, terminate the constraint section
+            break
+    # for each sequence, add its middle number if it is valid (part 1)
+    # or the middle number of its ordered version if it is not (part 2)
+    result = 0
+    for line in file:
+        sequence = [int(item) for item in line.strip().split(",")]
+        valid = is_valid(sequence, after)
+        if part == 1 and valid:
+            result += sequence[len(sequence) // 2]
+        elif part == 2 and not valid:
+            result += middle(sequence, after)
+
+    print(result)
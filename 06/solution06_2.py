@@ -1,7 +1,9 @@
+import argparse
+from array import array
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-import sys
-from typing import Tuple
+from typing import Optional, Tuple
 
 
 class Direction(Enum):
@@ -17,6 +19,10 @@ class Direction(Enum):
 
 Position = Tuple[int, int]
 
+# the directions in which the guard can move, in the order of the packed states
+MOVES = (Direction.North, Direction.East, Direction.South, Direction.West)
+MOVE_INDICES = {direction: index for index, direction in enumerate(MOVES)}
+
 
 def move(position: Position, direction: Direction) -> Position:
     """
@@ -37,11 +43,19 @@ def turn_right(direction: Direction) -> Direction:
     }[direction]
 
 
-def tour(position: Position, direction: Direction) -> Tuple[Position, Direction]:
+def tour(
+    position: Position, direction: Direction, obstacle: Optional[Position] = None
+) -> Tuple[Position, Direction]:
+    """
+    Perform a tour starting from `position`, facing towards `direction`,
+    yielding every position and direction along the way. The `obstacle` is
+    an additional obstacle that is taken into account without being placed
+    in the (shared) `data`.
+    """
     while True:
         new_position = move(position, direction)
         try:
-            if data[new_position] != '#':
+            if data[new_position] != '#' and new_position != obstacle:
                 position = new_position
             else:
                 direction = turn_right(direction)
@@ -50,58 +64,114 @@ def tour(position: Position, direction: Direction) -> Tuple[Position, Direction]
             break
 
 
-def tour_cycle(position, direction, visited) -> bool:
+class States:
+    """
+    A record of visited states, i.e. positions and directions, each one packed
+    into a single integer index. The record is reused from tour to tour: every
+    tour has its own generation and a state has only been visited during the
+    current tour if it is stamped with the current generation.
+    """
+
+    def __init__(self, height: int, width: int):
+        self.width = width
+        self.stamps = array("L", bytes(array("L").itemsize * height * width * len(MOVES)))
+        self.generation = 0
+
+    def clear(self):
+        """
+        Start a new tour, "forgetting" all the states visited so far
+        """
+        self.generation += 1
+
+    def visit(self, position: Position, direction: Direction) -> bool:
+        """
+        Record a visit to the state and return True if
+        it has already been visited during the current tour
+        """
+        row, column = position
+        index = (row * self.width + column) * len(MOVES) + MOVE_INDICES[direction]
+        if self.stamps[index] == self.generation:
+            return True
+        self.stamps[index] = self.generation
+        return False
+
+
+def tour_cycle(position, direction, obstacle) -> bool:
     """
-    Perform a tour starting from `position`, facing towards `direction` and return
-    True if a loop is detected or False otherwise. The `visited` argument is a
-    record of previously visited positions and directions and is not modified
-    when simulating the tour (an additional local record is kept instead).
+    Perform a tour starting from `position`, facing towards `direction`, with
+    an additional `obstacle` and return True if a loop is detected or False
+    otherwise. The visited positions and directions are kept in `states`.
     """
-    local_visited = defaultdict(set)
-    local_visited[position].add(direction)
-    for current_position, current_direction in tour(position, direction):
-        if current_direction in local_visited[current_position] or current_direction in visited:
+    states.clear()
+    states.visit(position, direction)
+    for current_position, current_direction in tour(position, direction, obstacle):
+        if states.visit(current_position, current_direction):
             return True
-        local_visited[current_position].add(current_direction)
     return False
 
 
-# read the input as a dict mapping (row, column) coordinates to their contents
-with open(sys.argv[1]) as file:
-    data = {}
-    start_position = None
-    for row, line in enumerate(file):
-        for column, letter in enumerate(line.strip()):
-            if letter == '^':
-                data[(row, column)] = '.'
-                start_position = (row, column)
-            else:
-                data[(row, column)] = letter
-
-
-result = 0
-# map each position to a set of directions in which they have been traversed
-# (for cycle detection)
-visited = defaultdict(set, {start_position: {Direction.North}})
-# perform a tour and, for every step of the tour...
-for position, direction in tour(start_position, Direction.North):
-    if direction in visited[position]:
-        continue
-    visited[position].add(direction)
-    # ... look ahead one step to the position where the obstacle will be placed
-    obstacle_position = move(position, direction)
-    try:
+def set_data(shared_data):
+    """
+    Initialise the (read-only) grid and the record of visited states
+    (in the main process or in a worker process)
+    """
+    global data, states
+    data = shared_data
+    height, width = (coordinate + 1 for coordinate in max(data))
+    states = States(height, width)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="number of processes among which the candidate obstacles are split"
+    )
+    args = parser.parse_args()
+
+    # read the input as a dict mapping (row, column) coordinates to their contents
+    with open(args.filename) as file:
+        data = {}
+        start_position = None
+        for row, line in enumerate(file):
+            for column, letter in enumerate(line.strip()):
+                if letter == '^':
+                    data[(row, column)] = '.'
+                    start_position = (row, column)
+                else:
+                    data[(row, column)] = letter
+    set_data(data)
+
+    # map each position to a set of directions in which they have been traversed
+    visited = defaultdict(set, {start_position: {Direction.North}})
+    # perform a tour and, for every step of the tour, collect the candidate
+    # obstacles along with the position and direction of the tour at that step
+    positions, directions, obstacles = [], [], []
+    for position, direction in tour(start_position, Direction.North):
+        if direction in visited[position]:
+            continue
+        visited[position].add(direction)
+        # look ahead one step to the position where the obstacle will be placed
+        obstacle_position = move(position, direction)
         # make sure the obstacle will be in the grid, in a position that doesn't
         # interrupt the current trajectory and no obstacle is already there
-        if data[obstacle_position] != "#" and not visited[obstacle_position]:
-            # place the obstacle
-            data[obstacle_position] = "#"
-            # and simulate the rest of the trajectory
-            if tour_cycle(position, turn_right(direction), visited):
-                result += 1
-            # remove the obstacle before continuing
-            data[obstacle_position] = "."
-    except KeyError:
-        pass
-
-print(result)
+        if data.get(obstacle_position, "#") != "#" and not visited[obstacle_position]:
+            # the tour will turn right when it finds the obstacle ahead
+            positions.append(position)
+            directions.append(turn_right(direction))
+            obstacles.append(obstacle_position)
+
+    # simulate the rest of the trajectory for each candidate obstacle
+    if args.workers == 1:
+        result = sum(map(tour_cycle, positions, directions, obstacles))
+    else:
+        with ProcessPoolExecutor(
+            args.workers, initializer=set_data, initargs=(data,)
+        ) as executor:
+            chunksize = len(obstacles) // (4 * args.workers) + 1
+            result = sum(
+                executor.map(tour_cycle, positions, directions, obstacles, chunksize=chunksize)
+            )
+
+    print(result)
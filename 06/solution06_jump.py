@@ -0,0 +1,148 @@
+"""
+Instead of moving one cell at a time, jump straight to the next turn,
+using a precomputed table of where the next obstacle is for every cell
+and direction. The extra obstacle that is tested for a loop is not placed
+in the grid or the table: the jumps that it affects, i.e. the ones on its
+row or column that would cross it, are cut short on the fly.
+
+# testing
+$ python3 solution06_jump.py input06_test.txt
+6
+# part 2
+$ python3 solution06_jump.py input06.txt
+1748
+"""
+
+import sys
+from typing import Optional
+
+# cells are indices in the grid, flattened row by row, and directions are
+# indices in DELTAS, so that turning right is moving to the next direction
+DELTAS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+NORTH = 0
+# the "cell" where a jump ends when the guard leaves the grid
+EXIT = -1
+
+
+def turn_right(direction: int) -> int:
+    return (direction + 1) % 4
+
+
+def read_grid(filename: str) -> tuple[str, int, int, int]:
+    """
+    Read the input and return the grid, flattened row by row,
+    its height and width and the starting cell of the guard
+    """
+    with open(filename) as file:
+        lines = file.read().split()
+    grid = "".join(lines)
+    return grid.replace("^", "."), len(lines), len(lines[0]), grid.index("^")
+
+
+def build_jumps(grid: str, height: int, width: int) -> list[list[int]]:
+    """
+    Return a table that maps every direction and cell to the cell where the
+    guard stops when moving from that cell in that direction, i.e. the cell
+    right before the next obstacle, or EXIT if there is no obstacle ahead
+    """
+    jumps = []
+    for row_offset, column_offset in DELTAS:
+        jump = [EXIT] * len(grid)
+        # visit the cells so that the one ahead of each cell is visited first
+        rows = range(height) if row_offset <= 0 else range(height - 1, -1, -1)
+        columns = range(width) if column_offset <= 0 else range(width - 1, -1, -1)
+        for row in rows:
+            for column in columns:
+                next_row, next_column = row + row_offset, column + column_offset
+                if not (0 <= next_row < height and 0 <= next_column < width):
+                    continue
+                ahead = next_row * width + next_column
+                jump[row * width + column] = (
+                    row * width + column if grid[ahead] == "#" else jump[ahead]
+                )
+        jumps.append(jump)
+    return jumps
+
+
+def jump(cell: int, direction: int, obstacle: Optional[int]) -> int:
+    """
+    Return the cell where the guard stops when moving from `cell` towards
+    `direction`, taking into account the extra `obstacle` (if any)
+    """
+    stop = jumps[direction][cell]
+    if obstacle is None:
+        return stop
+    row, column = divmod(cell, width)
+    obstacle_row, obstacle_column = divmod(obstacle, width)
+    row_offset, column_offset = DELTAS[direction]
+    # the distance to the extra obstacle, if it's ahead on the same row or column
+    if row_offset and obstacle_column == column:
+        distance = (obstacle_row - row) * row_offset
+    elif column_offset and obstacle_row == row:
+        distance = (obstacle_column - column) * column_offset
+    else:
+        return stop
+    if distance <= 0:
+        return stop
+    # the extra obstacle only matters if it's closer than the next obstacle
+    if stop != EXIT and distance > abs(stop - cell) // abs(row_offset * width + column_offset):
+        return stop
+    return cell + (distance - 1) * (row_offset * width + column_offset)
+
+
+def is_loop(cell: int, direction: int, obstacle: int, generation: int) -> bool:
+    """
+    Perform a tour starting from `cell`, facing towards `direction`, jumping
+    from turn to turn, and return True if a loop is detected (i.e. the guard
+    turns at the same cell towards the same direction twice) or False otherwise.
+    Every turn (cell and direction, packed into a single index) is stamped
+    with the `generation` of the tour in `turns`, which is shared by all tours.
+    """
+    while True:
+        cell = jump(cell, direction, obstacle)
+        if cell == EXIT:
+            return False
+        direction = turn_right(direction)
+        turn = cell * len(DELTAS) + direction
+        if turns[turn] == generation:
+            return True
+        turns[turn] = generation
+
+
+def candidates(start: int) -> list[tuple[int, int, int]]:
+    """
+    Perform the original tour one cell at a time and return the cells where an
+    obstacle could be placed, i.e. every cell on the tour (except the start),
+    along with the cell and the direction of the guard right before reaching
+    it for the first time: the tour up to that point is not affected
+    """
+    result = []
+    visited = {start}
+    cell, direction = start, NORTH
+    row, column = divmod(start, width)
+    while True:
+        row_offset, column_offset = DELTAS[direction]
+        next_row, next_column = row + row_offset, column + column_offset
+        if not (0 <= next_row < height and 0 <= next_column < width):
+            return result
+        ahead = next_row * width + next_column
+        if grid[ahead] == "#":
+            direction = turn_right(direction)
+            continue
+        if ahead not in visited:
+            visited.add(ahead)
+            result.append((ahead, cell, direction))
+        cell, row, column = ahead, next_row, next_column
+
+
+grid, height, width, start = read_grid(sys.argv[1])
+jumps = build_jumps(grid, height, width)
+turns = [0] * (len(grid) * len(DELTAS))
+
+# place an obstacle on every cell of the tour and check if the guard,
+# who will find it ahead of them and turn, ends up in a loop
+result = sum(
+    is_loop(cell, turn_right(direction), obstacle, generation)
+    for generation, (obstacle, cell, direction) in enumerate(candidates(start), 1)
+)
+print(result)
@@ -0,0 +1,58 @@
+"""
+Time the solver on synthetic equation files with long operand lists, for
+different sets of operators and numbers of worker processes. The (optional)
+arguments are the number of lines and the number of operands per line.
+
+$ python3 benchmark07.py 10000 12
+"""
+
+import os
+import random
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from solution07_operators import OPERATORS, evaluate
+
+OPERATOR_SETS = (("+", "*"), ("+", "*", "||"), ("+", "-", "^"))
+WORKERS = (1, 2, 4)
+
+
+def generate(filename: str, symbols: tuple[str, ...], lines: int, operands: int):
+    """
+    Write an equation file, where the target of every line is produced by
+    combining its operands with randomly chosen operators among `symbols`,
+    except for every other line, where the target is off by one (so it is
+    probably not possible to produce it)
+    """
+    rng = random.Random(2024)
+    with open(filename, "w") as file:
+        for line in range(lines):
+            numbers = [rng.randrange(1, 100) for _ in range(operands)]
+            target = numbers[0]
+            for number in numbers[1:]:
+                # pick operators until one produces a valid result
+                while (result := OPERATORS[rng.choice(symbols)].apply(target, number)) is None:
+                    pass
+                target = result
+            target += line % 2
+            file.write(f"{target}: {' '.join(str(number) for number in numbers)}\n")
+
+
+lines = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+operands = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+
+print(f"{lines} lines, {operands} operands per line ({os.cpu_count()} cpus)")
+print(f"{'operators':>12} {'workers':>8} {'time (s)':>9}")
+with TemporaryDirectory() as directory:
+    for symbols in OPERATOR_SETS:
+        filename = os.path.join(directory, "equations.txt")
+        generate(filename, symbols, lines, operands)
+        expected = None
+        for workers in WORKERS:
+            start = perf_counter()
+            result = evaluate(filename, list(symbols), workers)
+            elapsed = perf_counter() - start
+            assert expected is None or result == expected, f"{result} != {expected}"
+            expected = result
+            print(f"{' '.join(symbols):>12} {workers:>8} {elapsed:>9.3f}")
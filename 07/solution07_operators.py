@@ -0,0 +1,206 @@
+"""
+A single solver for any set of operators, picked by their symbols from a
+registry. All intermediate results are non-negative integers: e.g. a
+subtraction that would produce a negative number is not allowed.
+
+# testing
+$ python3 solution07_operators.py input07_test.txt + "*"
+3749
+$ python3 solution07_operators.py input07_test.txt + "*" "||"
+11387
+# part 1
+$ python3 solution07_operators.py input07.txt + "*"
+2654749936343
+# part 2, splitting the file among 4 processes
+$ python3 solution07_operators.py input07.txt + "*" "||" --workers 4
+124060392153684
+# other operators
+$ python3 solution07_operators.py input07.txt + - "^"
+6385
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise, repeat
+from operator import add, mul, xor
+import os
+from typing import Callable, NamedTuple, Optional
+
+# returned by `undo` when any result before applying the operator is valid
+# (e.g. multiplying anything by zero produces zero)
+ANY = object()
+
+
+class Operator(NamedTuple):
+    # combine the result so far with the next operand
+    # (or return None if there is no valid result)
+    apply: Callable[[int, int], Optional[int]]
+    # given the result of applying the operator with an `operand`, return the
+    # result before applying it, None if there is no such (valid) result, or
+    # ANY if every result is valid
+    undo: Callable[[int, int], Optional[int]]
+
+
+OPERATORS: dict[str, Operator] = {}
+
+
+def register(
+    symbol: str,
+    apply: Callable[[int, int], Optional[int]],
+    undo: Callable[[int, int], Optional[int]]
+):
+    """
+    Make an operator available to the solver under `symbol`
+    """
+    OPERATORS[symbol] = Operator(apply, undo)
+
+
+def power_of_ten(number: int) -> int:
+    """
+    Return the smallest power of ten that is larger than `number`, i.e. the
+    factor by which a number is shifted when `number` is concatenated to it
+    """
+    power = 10
+    while power <= number:
+        power *= 10
+    return power
+
+
+def undo_add(result: int, operand: int) -> Optional[int]:
+    return result - operand if result >= operand else None
+
+def undo_mul(result: int, operand: int) -> Optional[int]:
+    if not operand:
+        return ANY if not result else None
+    return result // operand if result % operand == 0 else None
+
+def concatenate(previous: int, operand: int) -> int:
+    return previous * power_of_ten(operand) + operand
+
+def undo_concatenate(result: int, operand: int) -> Optional[int]:
+    power = power_of_ten(operand)
+    return result // power if result % power == operand else None
+
+def subtract(previous: int, operand: int) -> Optional[int]:
+    return previous - operand if previous >= operand else None
+
+def undo_subtract(result: int, operand: int) -> Optional[int]:
+    return result + operand
+
+def undo_xor(result: int, operand: int) -> Optional[int]:
+    return result ^ operand
+
+
+register("+", add, undo_add)
+register("*", mul, undo_mul)
+register("||", concatenate, undo_concatenate)
+register("-", subtract, undo_subtract)
+register("^", xor, undo_xor)
+
+
+def check(numbers: list[int], target: int, operators: list[Operator]) -> bool:
+    """
+    Check if the `numbers` can be combined from left to right using the
+    `operators` to produce the `target`, working backwards from the target:
+    undo the operation applied with each number, starting from the last one.
+    The states (numbers left and intermediate target) that have been found
+    to fail are recorded, so that they aren't explored twice.
+    """
+    failed = set()
+
+    def produces(count: int, index: int, result: int) -> bool:
+        # check if the first `count` numbers produce any valid result at all,
+        # given the `result` of combining the numbers before `index`
+        if index == count:
+            return True
+        for operator in operators:
+            next_result = operator.apply(result, numbers[index])
+            if next_result is not None and produces(count, index + 1, next_result):
+                return True
+        return False
+
+    def search(count: int, target: int) -> bool:
+        last = numbers[count - 1]
+        if count == 1:
+            return target == last
+        if (count, target) in failed:
+            return False
+        for operator in operators:
+            previous = operator.undo(target, last)
+            if previous is ANY:
+                if produces(count - 1, 1, numbers[0]):
+                    return True
+            elif previous is not None and search(count - 1, previous):
+                return True
+        failed.add((count, target))
+        return False
+
+    return search(len(numbers), target)
+
+
+def get_chunks(filename: str, workers: int) -> list[tuple[int, int]]:
+    """
+    Split the input file into `workers` byte ranges of roughly equal size,
+    aligned so that every range starts at the beginning of a line
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as file:
+        for worker in range(1, workers):
+            # move to the approximate boundary and then to the start of the next line
+            file.seek(max(size * worker // workers, boundaries[-1]))
+            file.readline()
+            boundaries.append(min(file.tell(), size))
+    boundaries.append(size)
+    return list(pairwise(boundaries))
+
+
+def total(filename: str, start: int, end: int, symbols: list[str]) -> int:
+    """
+    Return the sum of the targets that can be produced using the operators
+    with the given `symbols`, for the lines in the byte range [`start`, `end`)
+    of the input file
+    """
+    operators = [OPERATORS[symbol] for symbol in symbols]
+    result = 0
+    with open(filename, "rb") as file:
+        file.seek(start)
+        for line in file:
+            if start >= end:
+                break
+            start += len(line)
+            # parsing
+            target_str, operands_str = line.split(b":")
+            target = int(target_str)
+            operands = [int(operand) for operand in operands_str.split()]
+            if check(operands, target, operators):
+                result += target
+    return result
+
+
+def evaluate(filename: str, symbols: list[str], workers: int = 1) -> int:
+    """
+    Return the sum of the targets that can be produced using the operators
+    with the given `symbols`, splitting the input file among `workers` processes
+    """
+    if workers == 1:
+        return total(filename, 0, os.path.getsize(filename), symbols)
+    # evaluate the lines in each chunk of the file in parallel
+    # and add up the partial sums
+    starts, ends = zip(*get_chunks(filename, workers))
+    with ProcessPoolExecutor(workers) as executor:
+        return sum(executor.map(total, repeat(filename), starts, ends, repeat(symbols)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename")
+    parser.add_argument("operators", nargs="+", choices=OPERATORS)
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="number of processes among which the input file is split"
+    )
+    args = parser.parse_args()
+
+    result = evaluate(args.filename, args.operators, args.workers)
+    print(result)
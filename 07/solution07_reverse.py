@@ -0,0 +1,73 @@
+"""
+Work backwards from the target, undoing the operation applied with the last
+operand: this is only possible for a few of the operators, so almost all
+of the combinations are pruned without being tried.
+
+# testing
+$ python3 solution07_reverse.py input07_test.txt 1
+3749
+$ python3 solution07_reverse.py input07_test.txt 2
+11387
+# part 1
+$ python3 solution07_reverse.py input07.txt 1
+2654749936343
+# part 2
+$ python3 solution07_reverse.py input07.txt 2
+124060392153684
+"""
+
+import sys
+
+
+def power_of_ten(number: int) -> int:
+    """
+    Return the smallest power of ten that is larger than `number`, i.e. the
+    factor by which a number is shifted when `number` is concatenated to it
+    """
+    power = 10
+    while power <= number:
+        power *= 10
+    return power
+
+
+def check(numbers, powers, count, target, concatenation) -> bool:
+    """
+    Check (recursively) if the first `count` of the `numbers` can be combined
+    from left to right using multiplication, addition or (if `concatenation`
+    is True) concatenation to produce the `target`. The `powers` are the
+    powers of ten that correspond to each number (see `power_of_ten`).
+    """
+    last = numbers[count - 1]
+    if count == 1:
+        return last == target
+    return (
+        # multiplication by zero, if the target is zero (whatever the other numbers)
+        (last == 0 and target == 0) or
+        # multiplication, if the target is divisible by the last number
+        (last != 0 and target % last == 0 and check(numbers, powers, count - 1, target // last, concatenation)) or
+        # addition, if the target is not smaller than the last number
+        (target >= last and check(numbers, powers, count - 1, target - last, concatenation)) or
+        # concatenation, if the target ends in the digits of the last number
+        (
+            concatenation and target % powers[count - 1] == last and
+            check(numbers, powers, count - 1, target // powers[count - 1], concatenation)
+        )
+    )
+
+
+concatenation = int(sys.argv[2]) == 2
+
+# read the input line by line, breaking it down into the target and operands
+result = 0
+with open(sys.argv[1]) as file:
+    for line in file:
+        # parsing
+        target_str, operands_str = line.strip().split(":")
+        target = int(target_str)
+        operands = [int(operand) for operand in operands_str.strip().split(" ")]
+        powers = [power_of_ten(operand) for operand in operands]
+        # call `check` to compute the result
+        if check(operands, powers, len(operands), target, concatenation):
+            result += target
+
+print(result)
@@ -0,0 +1,155 @@
+"""
+Store the antennas of each family as an array of (row, column) coordinates,
+compute the antinodes of all the pairs at once and mark them on a bitmap.
+
+# testing
+$ python3 solution08_numpy.py input08_test.txt 1
+14
+$ python3 solution08_numpy.py input08_test.txt 2
+34
+# part 1
+$ python3 solution08_numpy.py input08.txt 1
+291
+# part 2
+$ python3 solution08_numpy.py input08.txt 2
+1015
+# part 2, including the positions in between the antennas of each pair
+$ python3 solution08_numpy.py input08.txt 2 --rasterize
+1015
+"""
+
+import argparse
+from itertools import combinations
+from math import gcd
+
+import numpy as np
+
+
+def read_antennas(filename: str) -> tuple[dict[str, np.ndarray], tuple[int, int]]:
+    """
+    Read the input as a map from antenna families to an (n, 2) array
+    of the coordinates of each family's individual antennas and
+    return it along with the size of the grid
+    """
+    with open(filename, "rb") as file:
+        lines = file.read().split()
+    grid = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(len(lines), -1)
+    antennas = {
+        chr(symbol): np.argwhere(grid == symbol)
+        for symbol in np.unique(grid)
+        if symbol != ord(".")
+    }
+    return antennas, grid.shape
+
+
+def pairs(antennas: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the first antenna of every ordered pair of distinct antennas and
+    the distance vector from the second antenna of the pair to the first
+    """
+    first, second = np.nonzero(~np.eye(len(antennas), dtype=bool))
+    return antennas[first], antennas[first] - antennas[second]
+
+
+def max_harmonics(starts: np.ndarray, steps: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    """
+    Return, for every start and step, the largest number of steps
+    that can be taken from the start without leaving the grid
+    """
+    bounds = np.array(size) - 1
+    # the number of steps until each coordinate goes out of bounds
+    # (a coordinate that doesn't change never goes out of bounds)
+    limits = np.where(
+        steps > 0,
+        (bounds - starts) // np.maximum(steps, 1),
+        np.where(steps < 0, starts // np.maximum(-steps, 1), np.iinfo(np.int64).max)
+    )
+    return limits.min(axis=1)
+
+
+def antinodes(antennas: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    """
+    Return the antinodes created by every pair of antennas: for each pair,
+    one step beyond the first antenna, away from the second one
+    """
+    starts, steps = pairs(antennas)
+    in_bounds = max_harmonics(starts, steps, size) >= 1
+    return starts[in_bounds] + steps[in_bounds]
+
+
+def harmonic_antinodes(antennas: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    """
+    Return all the harmonic antinodes created by every pair of antennas: for
+    each pair, the arithmetic range of positions starting at the first antenna
+    and moving away from the second one, clipped to the grid
+    """
+    starts, steps = pairs(antennas)
+    counts = max_harmonics(starts, steps, size) + 1
+    # the pair and the harmonic of every antinode
+    pair_indices = np.repeat(np.arange(len(starts)), counts)
+    harmonics = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return starts[pair_indices] + harmonics[:, None] * steps[pair_indices]
+
+
+def harmonic_range(position: int, step: int, bound: int) -> tuple[float, float]:
+    """
+    Return the smallest and largest `k` such that `position + k * step`
+    is in the range [0, `bound`] (any `k` if `step` is zero)
+    """
+    if step > 0:
+        return -(position // step), (bound - position) // step
+    if step < 0:
+        return -((bound - position) // -step), position // -step
+    return -np.inf, np.inf
+
+
+def rasterize(bitmap: np.ndarray, antennas: np.ndarray):
+    """
+    Mark on the `bitmap` every grid position on the line through each pair of
+    antennas. The direction of the line is reduced by the gcd of its
+    coordinates, so that no grid position on it is skipped, and the first and
+    last position in the grid are computed directly, so that all the positions
+    are marked with a single slice assignment on the flattened bitmap.
+    """
+    height, width = bitmap.shape
+    flat = bitmap.reshape(-1)
+    for (row, column), (other_row, other_column) in combinations(antennas.tolist(), 2):
+        row_step, column_step = other_row - row, other_column - column
+        divisor = gcd(row_step, column_step)
+        row_step, column_step = row_step // divisor, column_step // divisor
+        row_low, row_high = harmonic_range(row, row_step, height - 1)
+        column_low, column_high = harmonic_range(column, column_step, width - 1)
+        low, high = int(max(row_low, column_low)), int(min(row_high, column_high))
+        # the positions on the line are evenly spaced on the flattened bitmap
+        stride = row_step * width + column_step
+        start = (row + low * row_step) * width + column + low * column_step
+        stop = start + (high - low + 1) * stride
+        flat[start:stop if stop >= 0 else None:stride] = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename")
+    parser.add_argument("part", type=int, choices=(1, 2))
+    parser.add_argument(
+        "--rasterize", action="store_true",
+        help="(part 2) mark every grid position on the line through each pair"
+    )
+    args = parser.parse_args()
+    if args.rasterize and args.part == 1:
+        parser.error("--rasterize only applies to part 2")
+
+    antennas, size = read_antennas(args.filename)
+    generate = antinodes if args.part == 1 else harmonic_antinodes
+
+    # mark the antinodes of every family on a bitmap of the grid
+    bitmap = np.zeros(size, dtype=bool)
+    for family in antennas.values():
+        if args.rasterize:
+            rasterize(bitmap, family)
+        else:
+            positions = generate(family, size)
+            bitmap[positions[:, 0], positions[:, 1]] = True
+
+    result = int(bitmap.sum())
+    print(result)
@@ -0,0 +1,85 @@
+"""
+Compare the list-based and the array-based solutions (loading included),
+on synthetic disk maps of increasing size. The (optional) argument is the
+size of the largest map, in digits.
+
+$ python3 benchmark09.py 1000000
+"""
+
+from itertools import accumulate
+import os
+import random
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import numpy as np
+
+import solution09_heap
+import solution09_numpy
+from solution09_twopointer import DIGITS, checksum
+
+
+def generate(filename: str, size: int):
+    """
+    Write a random disk map of `size` digits (rounded up to an odd number),
+    where every file has at least one block
+    """
+    rng = random.Random(2024)
+    with open(filename, "w") as file:
+        file.write("".join(
+            str(rng.randint(1 if index % 2 == 0 else 0, 9))
+            for index in range(size | 1)
+        ))
+        file.write("\n")
+
+
+def twopointer(filename: str) -> int:
+    with open(filename, "rb") as file:
+        return checksum(file.read().strip().translate(DIGITS))
+
+
+def heap(filename: str) -> int:
+    with open(filename) as file:
+        numbers = [int(digit) for digit in file.read().strip()]
+    offsets = [0, *accumulate(numbers)]
+    starts, sizes = offsets[0::2], numbers[0::2]
+    new_starts = solution09_heap.compact(starts, sizes, offsets[1::2], numbers[1::2])
+    return solution09_heap.checksum(new_starts, sizes)
+
+
+def numpy_part1(filename: str) -> int:
+    return solution09_numpy.compact_blocks(*solution09_numpy.read_disk_map(filename))
+
+
+def numpy_part2(filename: str) -> int:
+    starts, sizes, gap_starts, gap_sizes = solution09_numpy.read_disk_map(filename)
+    new_starts = solution09_heap.compact(
+        starts.tolist(), sizes.tolist(), gap_starts.tolist(), gap_sizes.tolist()
+    )
+    return solution09_numpy.checksum(np.array(new_starts), sizes)
+
+
+SOLUTIONS = (
+    (1, "twopointer", twopointer),
+    (1, "numpy", numpy_part1),
+    (2, "heap", heap),
+    (2, "numpy", numpy_part2),
+)
+
+largest = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+print(f"{'digits':>10} {'part':>5} {'solution':>11} {'time (s)':>9}")
+with TemporaryDirectory() as directory:
+    filename = os.path.join(directory, "diskmap.txt")
+    size = 1000
+    while size <= largest:
+        generate(filename, size)
+        expected = {}
+        for part, name, solve in SOLUTIONS:
+            start = perf_counter()
+            result = solve(filename)
+            elapsed = perf_counter() - start
+            assert expected.setdefault(part, result) == result, f"{result} != {expected[part]}"
+            print(f"{size:>10} {part:>5} {name:>11} {elapsed:>9.3f}")
+        size *= 10
@@ -0,0 +1,81 @@
+"""
+Keep the offset of every block instead of a list of files: the gaps are
+indexed by their size, in nine min-heaps of their offsets, so that the
+leftmost gap where a file fits is found by looking at the top of (at most)
+nine heaps, and the checksum is computed arithmetically from the offsets.
+
+# testing
+$ python3 solution09_heap.py input09_test.txt
+2858
+# part 2
+$ python3 solution09_heap.py input09.txt
+6478232739671
+"""
+
+from heapq import heappop, heappush
+from itertools import accumulate
+import sys
+from typing import Sequence
+
+# the largest possible size of a gap
+MAX_GAP = 9
+
+
+def compact(
+    starts: Sequence[int], sizes: Sequence[int],
+    gap_starts: Sequence[int], gap_sizes: Sequence[int]
+) -> list[int]:
+    """
+    Move every file (from the last to the first) to the leftmost gap that is
+    large enough to hold it, if there is one to the left of the file, and
+    return the new starting offsets of the files. The files and the gaps
+    are given as their starting offsets and their sizes.
+    """
+    # the offsets of the gaps of each size (offsets are increasing,
+    # so each list is already a heap)
+    gaps = [[] for _ in range(MAX_GAP + 1)]
+    for gap_start, gap_size in zip(gap_starts, gap_sizes):
+        if gap_size:
+            gaps[gap_size].append(gap_start)
+    new_starts = list(starts)
+    for id in range(len(sizes) - 1, -1, -1):
+        size, start = sizes[id], starts[id]
+        # the leftmost gap where the file fits, among the gaps of every
+        # large enough size, as long as it's to the left of the file
+        best_start, best_size = start, None
+        for gap_size in range(size, MAX_GAP + 1):
+            if gaps[gap_size] and gaps[gap_size][0] < best_start:
+                best_start, best_size = gaps[gap_size][0], gap_size
+        if best_size is None:
+            continue
+        heappop(gaps[best_size])
+        new_starts[id] = best_start
+        # whatever remains of the gap is a smaller gap
+        if best_size > size:
+            heappush(gaps[best_size - size], best_start + size)
+    return new_starts
+
+
+def checksum(starts: Sequence[int], sizes: Sequence[int]) -> int:
+    """
+    Return the sum of `id * offset` over all the blocks of all the files,
+    where the offsets of a file form an arithmetic series
+    """
+    return sum(
+        id * (size * start + size * (size - 1) // 2)
+        for id, (start, size) in enumerate(zip(starts, sizes))
+    )
+
+
+if __name__ == "__main__":
+    # read the input as a single long string
+    with open(sys.argv[1]) as file:
+        numbers = [int(digit) for digit in file.read().strip()]
+
+    # the offset where each file and gap starts
+    offsets = [0, *accumulate(numbers)]
+    starts, sizes = offsets[0::2], numbers[0::2]
+    gap_starts, gap_sizes = offsets[1::2], numbers[1::2]
+
+    new_starts = compact(starts, sizes, gap_starts, gap_sizes)
+    print(checksum(new_starts, sizes))
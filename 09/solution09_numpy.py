@@ -0,0 +1,101 @@
+"""
+Load the disk map as an array of digits and lay out the files and the gaps
+as columns of starting offsets and sizes. Part 1 is computed on the columns
+directly: the blocks that are moved and the gaps that receive them are cut
+into matching fragments, and the checksum of all the fragments is added up
+at once. Part 2 moves whole files with the gap heaps of solution09_heap.py.
+
+# testing
+$ python3 solution09_numpy.py input09_test.txt 1
+1928
+$ python3 solution09_numpy.py input09_test.txt 2
+2858
+# part 1
+$ python3 solution09_numpy.py input09.txt 1
+6446899523367
+# part 2
+$ python3 solution09_numpy.py input09.txt 2
+6478232739671
+"""
+
+import sys
+
+import numpy as np
+
+from solution09_heap import compact
+
+
+def read_disk_map(filename: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read the disk map and return the starting offsets and the sizes of the
+    files, followed by the starting offsets and the sizes of the gaps
+    """
+    with open(filename, "rb") as file:
+        numbers = np.frombuffer(file.read().strip(), dtype=np.uint8) - ord("0")
+    # the offset where each file and gap starts
+    offsets = np.zeros(len(numbers) + 1, dtype=np.int64)
+    np.cumsum(numbers, out=offsets[1:])
+    sizes = numbers.astype(np.int64)
+    return offsets[0:-1:2], sizes[0::2], offsets[1:-1:2], sizes[1::2]
+
+
+def series(ids: np.ndarray, starts: np.ndarray, sizes: np.ndarray) -> int:
+    """
+    Return the sum of `id * offset` over all the blocks of the fragments
+    with the given `ids`, `starts` and `sizes`
+    """
+    terms = ids * (sizes * starts + sizes * (sizes - 1) // 2)
+    # every term fits in 64 bits, but for large maps their sum doesn't
+    return sum(terms.tolist())
+
+
+def checksum(starts: np.ndarray, sizes: np.ndarray) -> int:
+    """
+    Return the sum of `id * offset` over all the blocks of all the files
+    """
+    return series(np.arange(len(sizes)), starts, sizes)
+
+
+def compact_blocks(
+    starts: np.ndarray, sizes: np.ndarray,
+    gap_starts: np.ndarray, gap_sizes: np.ndarray
+) -> int:
+    """
+    Return the checksum of the disk after moving blocks, one at a time, from
+    the end of the disk to the leftmost gap. Once compacted, the files fill
+    the disk up to their total size: the blocks beyond it are moved, in
+    reverse order, to the gaps before it.
+    """
+    ids = np.arange(len(sizes))
+    end = sizes.sum()
+    # the blocks of each file that stay in place, and the gaps that are filled
+    kept = np.clip(end - starts, 0, sizes)
+    filled = np.clip(end - gap_starts, 0, gap_sizes)
+    # the moved blocks (from the last file to the first) and the filled gaps
+    # (from the first to the last) are cut at the boundaries of both, into
+    # fragments that belong to a single file and a single gap
+    moved = (sizes - kept)[::-1]
+    moved_ends = np.cumsum(moved)
+    filled_ends = np.cumsum(filled)
+    cuts = np.sort(np.concatenate((moved_ends, filled_ends)))
+    fragment_sizes = np.diff(cuts, prepend=0)
+    # (dropping the repeated cuts, i.e. the empty fragments)
+    nonempty = fragment_sizes > 0
+    cuts, fragment_sizes = cuts[nonempty], fragment_sizes[nonempty]
+    fragment_starts = cuts - fragment_sizes
+    # the file and the gap of each fragment, and its offset within the gap
+    files = ids[::-1][np.searchsorted(moved_ends, fragment_starts, side="right")]
+    gaps = np.searchsorted(filled_ends, fragment_starts, side="right")
+    offsets = gap_starts[gaps] + fragment_starts - (filled_ends[gaps] - filled[gaps])
+    return series(ids, starts, kept) + series(files, offsets, fragment_sizes)
+
+
+if __name__ == "__main__":
+    starts, sizes, gap_starts, gap_sizes = read_disk_map(sys.argv[1])
+
+    if int(sys.argv[2]) == 1:
+        result = compact_blocks(starts, sizes, gap_starts, gap_sizes)
+    else:
+        new_starts = compact(starts.tolist(), sizes.tolist(), gap_starts.tolist(), gap_sizes.tolist())
+        result = checksum(np.array(new_starts), sizes)
+    print(result)
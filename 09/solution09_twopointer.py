@@ -0,0 +1,68 @@
+"""
+Compute the checksum of the compacted disk without building it: walk over
+the files from the left, filling the gap after each one with blocks of the
+files from the right, and add up the contribution of each fragment directly.
+
+# testing
+$ python3 solution09_twopointer.py input09_test.txt
+1928
+# part 1
+$ python3 solution09_twopointer.py input09.txt
+6446899523367
+"""
+
+import sys
+from typing import Sequence
+
+# map the characters of the digits to the values of the digits
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def fragment(id: int, start: int, size: int) -> int:
+    """
+    Return the contribution of `size` blocks of file `id`, placed from offset
+    `start` onwards, to the checksum (an arithmetic series of offsets)
+    """
+    return id * (size * start + size * (size - 1) // 2)
+
+
+def checksum(digits: Sequence[int]) -> int:
+    """
+    Return the checksum of the disk after moving blocks, one at a time, from
+    the end of the disk to the leftmost gap. The `digits` alternate between
+    the size of each file and the size of the gap after it.
+    """
+    result = 0
+    offset = 0
+    # the file on the left, being placed as it is, and
+    # the file on the right, being moved to the gaps on the left
+    left, right = 0, (len(digits) - 1) // 2
+    remaining = digits[2 * right]
+    while left < right:
+        size = digits[2 * left]
+        result += fragment(left, offset, size)
+        offset += size
+        # fill the gap after the left file with blocks of the right file
+        gap = digits[2 * left + 1]
+        while gap and left < right:
+            moved = min(gap, remaining)
+            result += fragment(right, offset, moved)
+            offset += moved
+            gap -= moved
+            remaining -= moved
+            if not remaining:
+                right -= 1
+                remaining = digits[2 * right]
+        left += 1
+    # whatever remains of the right file (if it hasn't already been placed)
+    if left == right:
+        result += fragment(right, offset, remaining)
+    return result
+
+
+if __name__ == "__main__":
+    # read the input as a single long string of digits (as values)
+    with open(sys.argv[1], "rb") as file:
+        digits = file.read().strip().translate(DIGITS)
+
+    print(checksum(digits))
@@ -0,0 +1,71 @@
+"""
+Give each peak its own bit and represent the set of peaks reachable from
+a position as an integer bitmask: the sets are propagated downhill, one
+height at a time, by OR-ing the masks into the neighbours in place, over a
+flat array of heights (padded so that every position has four neighbours).
+
+# testing
+$ python3 solution10_bitmask.py input10_test1.txt
+4
+$ python3 solution10_bitmask.py input10_test3.txt
+36
+# part 1
+$ python3 solution10_bitmask.py input10.txt
+709
+"""
+
+import sys
+
+# the height of the padding around the map and of the dots in the test cases
+# (low enough that no trail can go through them)
+NO_HEIGHT = -2
+
+
+def read_heights(filename: str) -> tuple[list[int], int]:
+    """
+    Read the map as a flat list of heights, padded with a border of
+    `NO_HEIGHT`, and return it along with the width of a (padded) row
+    """
+    with open(filename) as file:
+        lines = file.read().split()
+    width = len(lines[0]) + 2
+    heights = [NO_HEIGHT] * width
+    for line in lines:
+        heights.append(NO_HEIGHT)
+        heights.extend(NO_HEIGHT if height == "." else int(height) for height in line)
+        heights.append(NO_HEIGHT)
+    heights.extend([NO_HEIGHT] * width)
+    return heights, width
+
+
+def score(heights: list[int], width: int) -> int:
+    """
+    Return the sum over all the trailheads of the number of
+    peaks that can be reached from each trailhead
+    """
+    offsets = (-width, 1, width, -1)
+    # the positions of each height
+    layers = [[] for _ in range(10)]
+    for position, height in enumerate(heights):
+        if height >= 0:
+            layers[height].append(position)
+    # the set of reachable peaks from each position, as a bitmask --
+    # start from height 9, where each peak can only reach itself
+    masks = [0] * len(heights)
+    for bit, peak in enumerate(layers[9]):
+        masks[peak] = 1 << bit
+    for height in range(9, 0, -1):
+        for position in layers[height]:
+            mask = masks[position]
+            if not mask:
+                continue
+            for offset in offsets:
+                neighbour = position + offset
+                if heights[neighbour] == height - 1:
+                    masks[neighbour] |= mask
+    return sum(masks[trailhead].bit_count() for trailhead in layers[0])
+
+
+if __name__ == "__main__":
+    heights, width = read_heights(sys.argv[1])
+    print(score(heights, width))